@@ -0,0 +1,4 @@
+from myalx.cli import cli
+
+if __name__ == "__main__":
+    cli(prog_name="myalx")
@@ -1,14 +1,13 @@
 import re
+from importlib.metadata import version as package_version
 from pathlib import Path
-from urllib.parse import urlparse
 
 import click
-from decouple import Config, RepositoryEnv
-from scrapy.crawler import CrawlerProcess
 
-import myalx
-from myalx.project import ProjectCreator
-from myalx.spider import AlxSpider
+_DIGITS_RE = re.compile(r"^\d+$")
+_PROJECT_URL_RE = re.compile(
+    r"https://intranet\.alxswe\.com/projects/\d+(?:[/?#]|$)"
+)
 
 
 @click.group()
@@ -16,6 +15,8 @@ from myalx.spider import AlxSpider
 def cli(ctx):
     """Main entry point for myALX."""
 
+    from decouple import Config, RepositoryEnv
+
     config_file_path = Path("~/.alxconfig").expanduser()
     alx_config = Config(RepositoryEnv(config_file_path))
     ctx.obj = {"alx_config": alx_config}
@@ -48,47 +49,26 @@ def settings():
 def startproject(ctx, url, dir):
     """Create a new project."""
 
+    from myalx.project import ProjectCreator
+    from myalx.fetch import FetchError, fetch_project
+
     alx_config = ctx.obj.get("alx_config", {})
     user_email = alx_config("EMAIL")
     user_password = alx_config("PASSWORD")
 
     # Validate URL and extract project ID
-    allowed_domain = "intranet.alxswe.com"
-    if re.match(r"^\d+$", url):
-        url = f"https://{allowed_domain}/projects/{url}"
-
-    parsed_url = urlparse(url)
-    if not (
-        parsed_url.scheme == "https"
-        and parsed_url.netloc == allowed_domain
-        and re.match(r"/projects/\d+", parsed_url.path)
-    ):
+    if _DIGITS_RE.match(url):
+        url = f"https://intranet.alxswe.com/projects/{url}"
+
+    elif not _PROJECT_URL_RE.match(url):
         raise click.ClickException("Invalid URL.")
 
-    # Scrape data from URL
-    scraped_data = {}
-
-    def item_scraped(data):
-        scraped_data.update(data)
-
-    process = CrawlerProcess(
-        {
-            "ITEM_PIPELINES": {
-                "myalx.spider.AlxPipeline": 100,
-            },
-            "REQUEST_FINGERPRINTER_IMPLEMENTATION": "2.7",
-            "LOG_LEVEL": "INFO",
-            # "LOG_ENABLED": False,
-        }
-    )
-    process.crawl(
-        AlxSpider,
-        url=url,
-        email=user_email,
-        password=user_password,
-        callback=item_scraped,
-    )
-    process.start()
+    # Fetch project data from URL
+    try:
+        scraped_data = fetch_project(url, user_email, user_password)
+
+    except FetchError as e:
+        raise click.ClickException(str(e))
 
     # Create project based on scraped data
     project = ProjectCreator(scraped_data)
@@ -99,7 +79,7 @@ def startproject(ctx, url, dir):
 def version():
     """Print myALX version."""
 
-    click.echo(f"myALX {myalx.__version__}")
+    click.echo(f"myALX {package_version('myalx')}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,475 @@
+import html
+import os
+import re
+from functools import lru_cache
+from http.cookiejar import LoadError, MozillaCookieJar
+from pathlib import Path
+from typing import List, Optional, TypedDict
+from urllib.parse import urljoin
+
+from markdownify import markdownify
+from parsel import Selector
+from parsel.csstranslator import HTMLTranslator
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_COOKIE_FILE = "~/.cache/myalx/cookies.jar"
+
+_REQUIREMENT_RE = re.compile(
+    r"(?P<header>\d*-?[A-Za-z0-9_]+\.h)|(?P<readme>\d*-?README\.md)"
+)
+_MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
+_CAT_RE = re.compile(r"cat (?!-)((?:[^ \n\\]+|\\ )+)")
+_GCC_RE = re.compile(r"gcc .+")
+
+
+@lru_cache(maxsize=1024)
+def _markdownify(html_text: str, **options) -> str:
+    """Convert HTML to markdown, reusing results for repeated paragraphs."""
+
+    return markdownify(html_text, **options)
+
+
+# Project page selectors, translated to XPath once instead of per call
+_css_to_xpath = HTMLTranslator().css_to_xpath
+
+_XP_PROJECT_TITLE = _css_to_xpath("h1.gap::text")
+_XP_TAGS_PROPS = _css_to_xpath(
+    'div[data-react-class="tags/Tags"]::attr(data-react-props)'
+)
+_XP_METADATA_PROPS = _css_to_xpath(
+    'div[data-react-class="projects/ProjectMetadata"]'
+    "::attr(data-react-props)"
+)
+_XP_REQUIREMENTS = _css_to_xpath('h2:contains("Requirements") + * + ul')
+_XP_TASKS = _css_to_xpath("div[id^=task-num-]")
+_XP_TASK_TYPE = _css_to_xpath(".label-info::text")
+_XP_TASK_TITLE = _css_to_xpath(".panel-title::text")
+_XP_TASK_PROTOTYPES = _css_to_xpath(
+    ".panel-body ul li:contains('Prototype:') code::text"
+)
+_XP_TASK_SCORED_BODY = _css_to_xpath(
+    ".panel-body > .task_progress_score_bar ~ *"
+)
+_XP_TASK_USER_BODY = _css_to_xpath(".panel-body > #user_id ~ *")
+_XP_TASK_GITHUB_REPOSITORY = _css_to_xpath(
+    ".list-group-item > ul > li:contains('GitHub repository:') code::text"
+)
+_XP_TASK_DIRECTORY = _css_to_xpath(
+    ".list-group-item > ul > li:contains('Directory:') code::text"
+)
+_XP_TASK_FILE = _css_to_xpath(
+    ".list-group-item > ul > li:contains('File:') code::text"
+)
+
+_STATUS_ERRORS = {
+    404: "Page not found (404)",
+    410: "Gone (410)",
+    301: "Moved Permanently (301)",
+    500: "Internal Server Error (500)",
+}
+
+
+class AlxPipeline:
+    """Scrapy pipeline to process and export scraped data."""
+
+    def process_item(self, item, spider):
+        """Process a scraped item."""
+
+        # Determine project's main directory
+        item["directory"] = self.get_main_directory(item)
+        item["members"] = [name.title() for name in item.get("members", [])]
+
+        # Filter and clean scraped tasks
+        filtered_tasks = []
+        for task in item.get("tasks", []):
+            markdown_body = self.markdownify_body(task)
+
+            task["file"] = self.split_files(task)
+            task["test"] = self.extract_test_files(task)
+            task["compilation"] = self.extract_compilation_command(
+                markdown_body
+            )
+            task["body"] = self.clean_markdown_body(markdown_body)
+
+            filtered_tasks.append(self.clean_values(task))
+
+        item["tasks"] = filtered_tasks
+        item["requirements"] = self.extract_requirements(item)
+
+        # item = {
+        #     key: (value.strip() if isinstance(value, str) else value)
+        #     for key, value in item.items()
+        # }
+
+        return self.clean_values(item)
+
+    def get_main_directory(self, item) -> str:
+        """Get the main directory for the scraped item."""
+
+        tasks = item.get("tasks", [])
+        if not tasks:
+            return ""
+
+        first_task = tasks[0]
+        if "Group project" in item.get("tags", []):
+            return first_task.get("github_repository", "")
+
+        github_repo_count = directory_count = 0
+        for task in tasks:
+            if task.get("github_repository", ""):
+                github_repo_count += 1
+            if task.get("directory", ""):
+                directory_count += 1
+
+        if github_repo_count > directory_count:
+            return first_task.get("github_repository", "")
+
+        return first_task.get("directory", "")
+
+    def extract_requirements(self, item) -> dict:
+        """Extract requirements from the item."""
+
+        requirements = {}
+        for paragraph in item.get("requirements", []):
+            # Keep the first header and README match, stop once both are found
+            for match in _REQUIREMENT_RE.finditer(_markdownify(paragraph)):
+                key = "header" if match.lastgroup == "header" else "readme.md"
+                requirements.setdefault(key, match.group())
+
+                if len(requirements) == 2:
+                    return requirements
+
+        return requirements
+
+    def split_files(self, task) -> list:
+        """Split files if comma-separated."""
+
+        files = task.get("file", "")
+        return files.split(", ") if files else []
+
+    def markdownify_body(self, task: dict) -> list:
+        """Convert each HTML paragraph of a task's body to markdown."""
+
+        markdown_body = []
+
+        for paragraph in task.get("body", []):
+            paragraph = _markdownify(
+                paragraph, code_language="console", bullets="*"
+            )
+            markdown_body.append(paragraph.replace("\t", "  "))
+
+        return markdown_body
+
+    def clean_markdown_body(self, markdown_body: list) -> list:
+        """Clean the markdown body of a given task."""
+
+        cleaned_body = []
+
+        for paragraph in markdown_body:
+            paragraph = _MULTI_NEWLINE_RE.sub("\n", paragraph)
+            paragraph = paragraph.replace("\n```console", "```console")
+            paragraph = paragraph.replace("```\n", "```")
+            cleaned_body.extend(paragraph.split("\n"))
+
+        return cleaned_body
+
+    def extract_test_files(self, task: dict) -> list:
+        """Extract test files based on the task's content."""
+
+        test_files = []
+
+        for paragraph in task.get("body", []):
+            # Only paragraphs with a cat command can hold a test file
+            if "cat " not in paragraph:
+                continue
+
+            paragraph = html.unescape(paragraph)
+            match = _CAT_RE.search(paragraph)
+
+            if match:
+                test_file = match.group(1)
+                test_file = self.process_file_name(test_file)
+
+                cat_command = match.group(0)
+                lines = paragraph.split("\n")
+                start_index, end_index = 0, len(lines)
+                for index, line in enumerate(lines):
+
+                    if cat_command in line:
+                        start_index = index + 1
+                        break
+
+                for index in range(start_index, end_index):
+                    if "$" in lines[index] or "</code>" in lines[index]:
+                        end_index = index
+                        break
+
+                test_file_content = lines[start_index:end_index]
+                test_files.append(
+                    {
+                        "file": test_file,
+                        "content": test_file_content,
+                    }
+                )
+
+        return test_files
+
+    def process_file_name(self, file_name: str) -> str:
+        """
+        Process file name with spaces escaped by a backslash and
+        write it normally
+        """
+
+        if "\\" in file_name:
+            return file_name.replace("\\ ", " ")
+
+        return file_name
+
+    def extract_compilation_command(self, markdown_body: list) -> str:
+        """Extract compilation command from a task's markdown body."""
+
+        compilation_command = ""
+
+        for paragraph in markdown_body:
+            gcc_commands = _GCC_RE.findall(paragraph)
+            if gcc_commands:
+                gcc_commands = [
+                    html.unescape(command) for command in gcc_commands
+                ]
+                compilation_command = (
+                    " && ".join(gcc_commands)
+                    if len(gcc_commands) > 1
+                    else "".join(gcc_commands)
+                )
+
+        return compilation_command
+
+    def clean_values(self, obj: dict) -> dict:
+        """
+        Strip string values and drop keys with empty values (None, empty
+        string, list or dict) from a dictionary in place, in a single pass.
+        """
+
+        for key, value in list(obj.items()):
+            # Don't strip keys that contain test code
+            if type(value) is str and key != "content":
+                value = value.strip()
+                obj[key] = value
+
+            if not value:
+                del obj[key]
+
+        return obj
+
+
+class AlxTaskItem(TypedDict, total=False):
+    """Information about an ALX task."""
+
+    type: Optional[str]
+    title: Optional[str]
+    body: List[str]
+    prototype: List[str]
+    github_repository: Optional[str]
+    directory: Optional[str]
+    file: Optional[str]
+    test: List[dict]
+    compilation: str
+
+
+class AlxProjectItem(TypedDict, total=False):
+    """Information about an ALX project."""
+
+    title: Optional[str]
+    tags: List[str]
+    members: List[str]
+    tasks: List[AlxTaskItem]
+    directory: str
+    requirements: List[str]
+    # compilation: Optional[str]
+
+
+class FetchError(Exception):
+    """Raised when an ALX project page cannot be fetched."""
+
+
+def extract_project(page) -> AlxProjectItem:
+    """Extract the raw project data from a project page selector."""
+
+    project_item: AlxProjectItem = {}
+
+    # -- Project
+    project_item["title"] = page.xpath(_XP_PROJECT_TITLE).get()
+    # project_item["compilation"] = page.css(
+    #     'h3:contains("Compilation") + * + pre code::text'
+    # ).get()
+
+    # -- Tags
+    react_props = page.xpath(_XP_TAGS_PROPS).get()
+    tags_data = _json_loads(react_props) if react_props else {}
+    project_item["tags"] = [tag["value"] for tag in tags_data.get("tags", [])]
+
+    # -- ProjectMetadata
+    react_props = page.xpath(_XP_METADATA_PROPS).get()
+    metadata_data = _json_loads(react_props) if react_props else {}
+    project_item["members"] = (
+        metadata_data.get("metadata", {}).get("team", {}).get("members", [])
+    )
+
+    project_item["requirements"] = page.xpath(_XP_REQUIREMENTS).getall()
+
+    # -- Tasks
+    tasks = []
+    for task in page.xpath(_XP_TASKS):
+        task_item: AlxTaskItem = {}
+
+        # -- Heading
+        task_item["type"] = task.xpath(_XP_TASK_TYPE).get()
+        task_item["title"] = task.xpath(_XP_TASK_TITLE).get()
+
+        # -- Body
+        task_item["prototype"] = task.xpath(_XP_TASK_PROTOTYPES).getall()
+        scored_body = task.xpath(_XP_TASK_SCORED_BODY)
+        task_item["body"] = (
+            scored_body.getall()
+            if scored_body
+            else task.xpath(_XP_TASK_USER_BODY).getall()
+        )
+
+        # -- Group
+        task_item["github_repository"] = task.xpath(
+            _XP_TASK_GITHUB_REPOSITORY
+        ).get()
+        task_item["directory"] = task.xpath(_XP_TASK_DIRECTORY).get()
+        task_item["file"] = task.xpath(_XP_TASK_FILE).get()
+
+        tasks.append(task_item)
+
+    project_item["tasks"] = tasks
+
+    return project_item
+
+
+def fetch_project(url: str, email: str, password: str) -> dict:
+    """
+    Fetch a single ALX project page, logging in if needed, and return the
+    processed project data.
+
+    Session cookies are kept in `~/.cache/myalx/cookies.jar` so later calls
+    can skip the login round trips while the session is still valid.
+    """
+
+    import httpx
+
+    cookie_jar = _load_cookie_jar()
+
+    try:
+        # One client for the whole exchange, so the login and the project
+        # request share a single TCP/TLS connection
+        with httpx.Client(
+            cookies=cookie_jar,
+            http2=True,
+            follow_redirects=True,
+            timeout=15,
+            limits=httpx.Limits(
+                max_keepalive_connections=10, keepalive_expiry=30
+            ),
+        ) as client:
+            response = client.get(url)
+
+            if response.status_code == 401:
+                # The saved session was rejected, start a fresh one
+                cookie_jar.clear()
+                response = client.get(urljoin(url, "/auth/sign_in"))
+
+            if "auth/sign_in" in str(response.url):
+                login_response = _login(client, response, email, password)
+                if "signed_in" not in login_response.text:
+                    raise FetchError(_describe_failure(login_response))
+
+                response = client.get(url)
+
+    except httpx.HTTPError as e:
+        raise FetchError(f"Request failed for URL: {url} ({e})") from e
+
+    if response.status_code != 200:
+        raise FetchError(_describe_failure(response))
+
+    _save_cookie_jar(cookie_jar)
+
+    project_dict = extract_project(_parse_page(response))
+    return AlxPipeline().process_item(project_dict, None)
+
+
+def _parse_page(response) -> Selector:
+    """Parse the raw response body, leaving the decoding to lxml."""
+
+    # parsel rejects an empty body, error responses often have one
+    if not response.content:
+        return Selector(text="")
+
+    return Selector(body=response.content, encoding=response.encoding)
+
+
+def _load_cookie_jar() -> MozillaCookieJar:
+    """Load the saved session cookies, if any."""
+
+    cookie_jar = MozillaCookieJar(Path(_COOKIE_FILE).expanduser())
+
+    try:
+        cookie_jar.load(ignore_discard=True)
+
+    except (FileNotFoundError, LoadError):
+        pass
+
+    return cookie_jar
+
+
+def _save_cookie_jar(cookie_jar: MozillaCookieJar) -> None:
+    """Save the session cookies, readable by the current user only."""
+
+    cookie_file = Path(cookie_jar.filename)
+    cookie_file.parent.mkdir(parents=True, exist_ok=True)
+    os.close(os.open(cookie_file, os.O_WRONLY | os.O_CREAT, 0o600))
+    cookie_jar.save(ignore_discard=True)
+
+
+def _login(client, response, email: str, password: str):
+    """Submit the sign-in form found in `response`."""
+
+    page = _parse_page(response)
+    form = page.xpath("//form[.//input[@name='authenticity_token']]")
+
+    login_payload = {
+        field.attrib["name"]: field.attrib.get("value", "")
+        for field in form.css("input[name]")
+        if field.attrib.get("type") not in ("submit", "checkbox")
+    }
+    login_payload.update(
+        {
+            "user[email]": email,
+            "user[password]": password,
+        }
+    )
+
+    action = urljoin(str(response.url), form.attrib.get("action", ""))
+    return client.post(action, data=login_payload)
+
+
+def _describe_failure(response) -> str:
+    """Build an error message for a failed login or project request."""
+
+    page = _parse_page(response)
+    alert = page.css(".alert.alert-danger::text").get()
+
+    if alert is not None:
+        return alert.strip()
+
+    status = response.status_code
+    status_error = _STATUS_ERRORS.get(
+        status, f"Unexpected error (HTTP {status})"
+    )
+    return f"{status_error} for URL: {response.url}"
@@ -1,8 +1,152 @@
+import os
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+
+# Trailing identifier of a declaration that also has a type: "char *s"
+_DECLARATOR_RE = re.compile(r"\w\s+\**(\w+)\s*$")
+_OUTFILE_RE = re.compile(r"-o\s+(\S+)")
+# "_putchar.c" as a whole whitespace-separated word of a gcc command
+_PUTCHAR_RE = re.compile(r"(?<!\S)_putchar\.c(?!\S)")
+
+# Header names are ASCII ("main.h"), their guard is "MAIN_H"
+_HEADER_GUARD_TABLE = str.maketrans(
+    string.ascii_lowercase + ".", string.ascii_uppercase + "_"
+)
+
+_SCRIPT_EXTS = frozenset(
+    {
+        ".py",
+        ".sh",
+        ".rb",
+        ".pl",
+        ".php",
+        ".js",
+        ".java",
+        ".cpp",
+        ".c",
+        ".cs",
+    }
+)
+
+
+_BASH_SHEBANG = b"#!/bin/bash"
+_PYTHON_SHEBANG = b"#!/usr/bin/python3"
+
+_BASH_HEADER = (_BASH_SHEBANG, b"")
+
+_C_MAIN_BODY = (
+    "",
+    "/**",
+    " * main - Entry point",
+    " * ",
+    " * Return: Always 0 (Success)",
+    " */",
+    "",
+    "int main(void)",
+    "{",
+    "\t/* your code goes here */",
+    "\treturn (0);",
+    "}",
+    "",
+)
+
+_C_DOC_RETURN = (
+    " * ",
+    " * Return: Description of the returned value.",
+    " */",
+    "",
+)
+
+_C_FUNCTION_BODY = (
+    "{",
+    "\t/* your code goes here */",
+    "}",
+    "",
+)
+
+_PUTCHAR_CONTENT = (
+    "#include <unistd.h>",
+    "",
+    "/**",
+    " * _putchar - writes the character c to stdout",
+    " * @c: The character to print",
+    " *",
+    " * Return: On success 1.",
+    " * On error, -1 is returned, and errno is set appropriately",
+    " */",
+    "",
+    "int _putchar(char c)",
+    "{",
+    "\treturn (write(1, &c, 1));",
+    "}",
+    "",
+)
+
+_MAKEFILE_ALL_RULE = (
+    "all:",
+    "\tgcc -Wall -Werror -Wextra -pedantic -std=gnu89 *.c",
+    "",
+)
+
+_README_FOOTER = (
+    "",
+    "---",
+    "",
+    "*Please note that this README is dynamically generated and may not always reflect the most up-to-date information about the project.*",
+    "",
+    "---",
+    "",
+)
+
+_AUTHORS_HEADER = (
+    "# This file lists all contributors to the repository.",
+    "",
+    "",
+)
+
+
+def _parse_prototype(prototype: str) -> Optional[tuple]:
+    """Return the function name and parameter names of a C prototype."""
+
+    # The parameters run up to the last closing parenthesis, so function
+    # pointer parameters do not cut them short
+    signature, _, rest = prototype.partition("(")
+    parameters, closing_paren, _ = rest.rpartition(")")
+    match = _DECLARATOR_RE.search(signature) if closing_paren else None
+    if not match:
+        return None
+
+    parameter_names = [
+        declarator.group(1)
+        for declarator in map(_DECLARATOR_RE.search, parameters.split(","))
+        if declarator
+    ]
+    return match.group(1), parameter_names
+
+
+def _has_shebang(line) -> bool:
+    """Return whether a str or bytes content line starts with a shebang."""
+
+    return line.startswith(b"#!" if isinstance(line, bytes) else "#!")
+
+
+@lru_cache(maxsize=None)
+def _test_files_re(test_files: tuple) -> re.Pattern:
+    """Return a compiled whole-word pattern matching any of `test_files`."""
+
+    # Longest names first, so "0-main.c" wins over "main.c"
+    names = sorted(test_files, key=len, reverse=True)
+    return re.compile(rf"\b(?:{'|'.join(map(re.escape, names))})\b")
 
 
 class FileHandler:
+    # Test files are written by a single handler, see DefaultFileHandler
+    creates_test_files = False
+
     def __init__(
         self, json_data: dict, handler_name: str, file_extension: str
     ) -> None:
@@ -10,48 +154,107 @@ class FileHandler:
         self._handler_name = handler_name
         self.file_extension = file_extension
 
+        self._tasks = json_data.get("tasks", [])
+        self._tags = frozenset(json_data.get("tags", []))
+
+        root_directory = json_data.get("directory", "")
+        self._root_directory = (
+            Path(root_directory) if root_directory else Path.cwd()
+        )
+
+        # (directory, name) of the files the handler generates itself,
+        # rather than as task files
+        self._generated_files = frozenset()
+
     def create_and_populate_files(self) -> None:
         """Create and populate files for the project."""
 
-        tasks = self._json_data.get("tasks", [])
-        for task in tasks:
+        # Group files by the directory they live in, so each directory is
+        # listed and created only once
+        pending_files = {}
+
+        for task in self._tasks:
             directory = self.get_task_directory(task)
 
             for task_file in task.get("file", []):
-                task_file_path = directory / task_file
-                task_file_content = self.get_file_content(task_file_path, task)
-                self.write_to_file(directory, task_file, task_file_content)
+                suffix = os.path.splitext(task_file)[1]
+
+                # Only build a new Path when the file lives in a subdirectory
+                subdirectory, name = os.path.split(task_file)
+                parent = (
+                    directory / subdirectory if subdirectory else directory
+                )
+                if not self.owns_file(parent, name, suffix):
+                    continue
+
+                task_file_content = self.get_file_content(suffix, task)
+                pending_files.setdefault(parent, []).append(
+                    (name, task_file_content)
+                )
+
+            if not self.creates_test_files:
+                continue
 
             tests_directory = directory / "tests"
             for test in task.get("test", []):
                 test_file = test.get("file", "")
+                if not test_file:
+                    continue
+
+                subdirectory, name = os.path.split(test_file)
+                parent = (
+                    tests_directory / subdirectory
+                    if subdirectory
+                    else tests_directory
+                )
                 test_file_content = test.get("content", "")
-                self.write_to_file(
-                    tests_directory, test_file, test_file_content
+                pending_files.setdefault(parent, []).append(
+                    (name, test_file_content)
                 )
 
-    def get_root_directory(self) -> Path:
+        for directory, files in pending_files.items():
+            existing_files = self.list_directory(directory)
+            for name, content in files:
+                self.write_to_file(directory, name, content, existing_files)
+
+    def owns_file(self, directory: Path, name: str, suffix: str) -> bool:
+        """Return whether this handler creates the task file `name`."""
+
+        return suffix == self.file_extension
 
-        root_directory = self._json_data.get("directory", "")
+    def generated_files(self) -> frozenset:
+        """Return the (directory, name) of the files generated from tasks."""
 
-        if not root_directory:
-            return Path.cwd()
+        return self._generated_files
 
-        return Path(root_directory)
+    def list_directory(self, directory: Path) -> set:
+        """Return the names in `directory`, creating it if it is missing."""
+
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+
+        except FileNotFoundError:
+            directory.mkdir(parents=True, exist_ok=True)
+            return set()
+
+    def get_root_directory(self) -> Path:
+
+        return self._root_directory
 
     def get_task_directory(self, task: dict) -> Path:
 
         directory = task.get("directory", "")
-        root_directory = self.get_root_directory()
+        root_directory = self._root_directory
 
         if root_directory.name != directory:
             return root_directory / directory
 
         return Path(directory)
 
-    def get_file_content(self, path: Path, task) -> list:
+    def get_file_content(self, suffix: str, task) -> list:
 
-        if path.suffix == self.file_extension:
+        if suffix == self.file_extension:
             return self.get_file_content_specific(task)
 
         return []
@@ -62,47 +265,58 @@ class FileHandler:
             "Subclasses must implement get_file_content_specific method"
         )
 
-    def write_to_file(self, directory: Path, name: str, content: list) -> None:
+    def write_to_file(
+        self,
+        directory: Path,
+        name: str,
+        content: list,
+        existing_files: Optional[set] = None,
+    ) -> None:
 
         file_path = directory / name
 
-        if file_path.exists():
-            return
+        if existing_files is None:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
-
-        if content:
-            with file_path.open("w", encoding="utf-8") as f:
-                f.write("\n".join(content))
+        elif name in existing_files:
+            return
 
-            self.modify_script_file_permissions(file_path)
+        # Scripts starting with a shebang are created executable, the
+        # process umask still applies as it would for chmod +x
+        is_script = (
+            bool(content)
+            and _has_shebang(content[0])
+            and self.is_script_file(name)
+        )
+        mode = 0o777 if is_script else 0o666
 
-    def modify_script_file_permissions(self, path: Path) -> None:
+        # O_EXCL makes creation fail if the file already exists
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        except FileExistsError:
+            return
 
-        if path.is_file() and self.is_script_file(path):
-            with path.open("r") as file:
-                line = file.readline()
+        try:
+            if content:
+                # Content lines may be str or already encoded bytes
+                payload = b"\n".join(
+                    line if isinstance(line, bytes) else line.encode("utf-8")
+                    for line in content
+                )
+                if not payload.endswith(b"\n"):
+                    payload += b"\n"
 
-                if line.strip().startswith("#!"):
-                    path.chmod(path.stat().st_mode | 0o111)
+                payload = memoryview(payload)
+                while payload:
+                    payload = payload[os.write(fd, payload) :]
 
-    def is_script_file(self, path: Path) -> bool:
+        finally:
+            os.close(fd)
 
-        script_extensions = [
-            ".py",
-            ".sh",
-            ".rb",
-            ".pl",
-            ".php",
-            ".js",
-            ".java",
-            ".cpp",
-            ".c",
-            ".cs",
-        ]
+    def is_script_file(self, name: str) -> bool:
 
-        return path.suffix.lower() in script_extensions or not path.suffix
+        suffix = os.path.splitext(name)[1]
+        return not suffix or suffix.lower() in _SCRIPT_EXTS
 
 
 class BashFileHandler(FileHandler):
@@ -110,147 +324,188 @@ class BashFileHandler(FileHandler):
         super().__init__(json_data, "Bash", ".sh")
 
     def get_file_content_specific(self, task: dict) -> list:
-        return ["#!/bin/bash", ""]
+        return _BASH_HEADER
 
 
 class CFileHandler(FileHandler):
     def __init__(self, json_data: dict) -> None:
         super().__init__(json_data, "C", ".c")
 
+        self._is_c_project = self._handler_name in self._tags
+        self._is_group_project = "Group project" in self._tags
+
+        self._requirements = json_data.get("requirements", {})
+        self._header_file_name = self._requirements.get("header", "")
+        self._include_line = (
+            f'#include "{self._header_file_name}"'
+            if self._header_file_name
+            else "#include <stdio.h>"
+        )
+
+        if self._is_c_project:
+            self.collect_task_data()
+
+    def collect_task_data(self) -> None:
+        """Collect the Makefile rules and header declarations of the tasks."""
+
+        # A single pass over the tasks collects both the Makefile rules and
+        # the header declarations
+        self._makefile_is_required = self._is_group_project
+        self._makefile_rules = []
+        self._output_filenames = set()
+        self._putchar_is_required = False
+        self._prototypes = []
+
+        for task in self._tasks:
+            compilation_command = task.get("compilation")
+            if compilation_command:
+                self._makefile_is_required = True
+                self.add_makefile_rules(
+                    task,
+                    compilation_command,
+                    self._makefile_rules,
+                    self._output_filenames,
+                )
+
+                if not self._putchar_is_required:
+                    self._putchar_is_required = bool(
+                        _PUTCHAR_RE.search(compilation_command)
+                    )
+
+            self._prototypes.extend(task.get("prototype", ()))
+
+        # Generated files take precedence over task files of the same name,
+        # no other handler creates them
+        generated_names = []
+        if self._makefile_is_required:
+            generated_names.append("Makefile")
+
+        if self._header_file_name:
+            generated_names.append(self._header_file_name)
+            if self._putchar_is_required:
+                generated_names.append("_putchar.c")
+
+        root_directory = self.get_root_directory()
+        self._generated_files = frozenset(
+            (root_directory, name) for name in generated_names
+        )
+
     def create_and_populate_files(self) -> None:
+        if not self._is_c_project:
+            return
+
         super().create_and_populate_files()
 
+        # The Makefile, header and _putchar.c share the root directory, so
+        # it is listed and created once for all three
         root_directory = self.get_root_directory()
-        self.create_and_populate_makefile_file(root_directory)
-        self.create_and_populate_header_file(root_directory)
+        existing_files = self.list_directory(root_directory)
+
+        if self._makefile_is_required:
+            self.create_and_populate_makefile_file(
+                root_directory,
+                self._makefile_rules,
+                self._output_filenames,
+                existing_files,
+            )
 
-    def get_file_content_specific(self, task: dict) -> list:
+        if self._header_file_name:
+            self.create_and_populate_header_file(
+                root_directory,
+                self._prototypes,
+                self._putchar_is_required,
+                existing_files,
+            )
 
-        c_file_content = []
+    def owns_file(self, directory: Path, name: str, suffix: str) -> bool:
+        return (
+            self._is_c_project
+            and super().owns_file(directory, name, suffix)
+            and (directory, name) not in self._generated_files
+        )
 
-        requirements = self._json_data.get("requirements", {})
-        header_file_name = requirements.get("header", "")
+    def get_file_content_specific(self, task: dict) -> list:
 
-        c_file_content.append(
-            f'#include "{header_file_name}"'
-            if header_file_name
-            else "#include <stdio.h>"
-        )
+        c_file_content = [self._include_line]
 
         prototypes = task.get("prototype", [])
         if prototypes:
             for prototype in prototypes:
-                match = re.search(r"\w+\s+\**(\w+)\s*\([^)]*\)", prototype)
-                if match:
-                    function_name = match.group(1)
-                    parameters = re.findall(
-                        r"\b\w+\s+\**(\w+)\s*(?:,|\))", prototype
-                    )
+                parsed_prototype = _parse_prototype(prototype)
+                if parsed_prototype:
+                    function_name, parameters = parsed_prototype
 
                 else:
                     function_name = "function_name"
                     parameters = ["parameterx"]
 
                 c_file_content.extend(
-                    [
+                    (
                         "",
                         "/**",
                         f" * {function_name} - Short description, single line.",
-                        *[
-                            f" * @{parameter}: Description of parameter {parameter}."
-                            for parameter in parameters
-                        ],
-                        " * ",
-                        " * Return: Description of the returned value.",
-                        " */",
-                        "",
-                        f"{re.sub(r';', '', prototype)}",
-                        "{",
-                        "\t/* your code goes here */",
-                        "}",
-                        "",
-                    ]
+                    )
+                )
+                c_file_content.extend(
+                    f" * @{parameter}: Description of parameter {parameter}."
+                    for parameter in parameters
                 )
+                c_file_content.extend(_C_DOC_RETURN)
+                c_file_content.append(prototype.replace(";", ""))
+                c_file_content.extend(_C_FUNCTION_BODY)
 
         else:
-            c_file_content.extend(
-                [
-                    "",
-                    "/**",
-                    " * main - Entry point",
-                    " * ",
-                    " * Return: Always 0 (Success)",
-                    " */",
-                    "",
-                    "int main(void)",
-                    "{",
-                    "\t/* your code goes here */",
-                    "\treturn (0);",
-                    "}",
-                    "",
-                ]
-            )
+            c_file_content.extend(_C_MAIN_BODY)
 
         return c_file_content
 
-    def create_and_populate_makefile_file(self, directory: Path) -> None:
-        """Create and populate the Makefile for the project."""
-
-        tags = self._json_data.get("tags", [])
-        if self._handler_name not in tags:
-            return
-
-        makefile_is_required = False
-        makefile_content = [
-            "# Makefile for Your Project",
-            "",
-        ]
-
-        output_filenames = set()
+    def add_makefile_rules(
+        self,
+        task: dict,
+        compilation_command: str,
+        makefile_rules: list,
+        output_filenames: set,
+    ) -> None:
+        """Append the Makefile rules of a task with a compilation command."""
 
-        tasks = self._json_data.get("tasks", [])
-        for task in tasks:
-            compilation_command = task.get("compilation", "")
+        # Replace file paths in makefile gcc_command in a single pass
+        test_files = tuple(
+            test["file"]
+            for test in task.get("test", ())
+            if test.get("file") and test["file"] in compilation_command
+        )
+        if test_files:
+            compilation_command = _test_files_re(test_files).sub(
+                r"tests/\g<0>", compilation_command
+            )
 
-            if not compilation_command:
-                continue
+        # Extract output filenames for cleaning
+        output_filenames.update(_OUTFILE_RE.findall(compilation_command))
 
-            makefile_is_required = True
+        for task_file in task.get("file", ()):
+            stem, suffix = os.path.splitext(os.path.basename(task_file))
 
-            # Replace file paths in makefile gcc_command
-            for test_file in (
-                test_file.get("file", "") for test_file in task.get("test", [])
-            ):
-                if test_file and test_file in compilation_command.strip():
-                    pattern = rf"\b{re.escape(test_file)}\b"
-                    compilation_command = re.sub(
-                        pattern, f"tests/{test_file}", compilation_command
-                    )
+            if suffix == ".c":
+                makefile_rules.append(f"{stem}:")
+                makefile_rules.append(f"\t{compilation_command}\n")
 
-            # Extract output filenames for cleaning
-            matches = re.findall(r"-o\s+(\S+)", compilation_command)
-            output_filenames.update(matches)
+    def create_and_populate_makefile_file(
+        self,
+        directory: Path,
+        makefile_rules: list,
+        output_filenames: set,
+        existing_files: Optional[set] = None,
+    ) -> None:
+        """Create and populate the Makefile for the project."""
 
-            for task_file in task.get("file", []):
-                task_file_path = directory / task_file
-
-                if task_file_path.suffix == ".c":
-                    makefile_content.extend(
-                        [
-                            f"{task_file_path.stem}:",
-                            f"\t{compilation_command}\n",
-                        ]
-                    )
+        makefile_content = [
+            "# Makefile for Your Project",
+            "",
+        ]
+        makefile_content.extend(makefile_rules)
 
-        if "Group project" in tags:
-            makefile_is_required = True
-            makefile_content.extend(
-                [
-                    "all:",
-                    "\tgcc -Wall -Werror -Wextra -pedantic -std=gnu89 *.c",
-                    "",
-                ]
-            )
+        if self._is_group_project:
+            makefile_content.extend(_MAKEFILE_ALL_RULE)
 
         if output_filenames:
             makefile_content.extend(
@@ -262,17 +517,23 @@ class CFileHandler(FileHandler):
                 ]
             )
 
-        if makefile_is_required:
-            self.write_to_file(directory, "Makefile", makefile_content)
+        self.write_to_file(
+            directory, "Makefile", makefile_content, existing_files
+        )
 
-    def create_and_populate_header_file(self, directory: Path) -> None:
+    def create_and_populate_header_file(
+        self,
+        directory: Path,
+        prototypes: list,
+        putchar_is_required: bool,
+        existing_files: Optional[set] = None,
+    ) -> None:
 
-        requirements = self._json_data.get("requirements", {})
-        header_file_name = requirements.get("header", "")
-        if not header_file_name:
-            return
+        header_file_name = self._header_file_name
 
-        header_file_name_upper = header_file_name.upper().replace(".", "_")
+        header_file_name_upper = header_file_name.translate(
+            _HEADER_GUARD_TABLE
+        )
 
         header_file_content = [
             f"#ifndef {header_file_name_upper}",
@@ -286,18 +547,11 @@ class CFileHandler(FileHandler):
             "",
         ]
 
-        putchar_is_required = any(
-            "_putchar.c" in task.get("compilation", "").split()
-            for task in self._json_data.get("tasks", [])
-        )
         if putchar_is_required:
             header_file_content.append("int _putchar(char c);")
-            self.create_and_populate_putchar_file(directory)
+            self.create_and_populate_putchar_file(directory, existing_files)
 
-        for task in self._json_data.get("tasks", []):
-            prototypes = task.get("prototype", [])
-            for prototype in prototypes:
-                header_file_content.append(prototype)
+        header_file_content.extend(prototypes)
 
         header_file_content.extend(
             [
@@ -307,29 +561,17 @@ class CFileHandler(FileHandler):
             ]
         )
 
-        self.write_to_file(directory, header_file_name, header_file_content)
-
-    def create_and_populate_putchar_file(self, directory: Path) -> None:
+        self.write_to_file(
+            directory, header_file_name, header_file_content, existing_files
+        )
 
-        putchar_file_content = [
-            "#include <unistd.h>",
-            "",
-            "/**",
-            " * _putchar - writes the character c to stdout",
-            " * @c: The character to print",
-            " *",
-            " * Return: On success 1.",
-            " * On error, -1 is returned, and errno is set appropriately",
-            " */",
-            "",
-            "int _putchar(char c)",
-            "{",
-            "\treturn (write(1, &c, 1));",
-            "}",
-            "",
-        ]
+    def create_and_populate_putchar_file(
+        self, directory: Path, existing_files: Optional[set] = None
+    ) -> None:
 
-        self.write_to_file(directory, "_putchar.c", putchar_file_content)
+        self.write_to_file(
+            directory, "_putchar.c", _PUTCHAR_CONTENT, existing_files
+        )
 
 
 class PythonFileHandler(FileHandler):
@@ -338,7 +580,7 @@ class PythonFileHandler(FileHandler):
 
     def get_file_content_specific(self, task: dict) -> list:
 
-        py_file_content = ["#!/usr/bin/python3"]
+        py_file_content = [_PYTHON_SHEBANG]
 
         prototypes = task.get("prototype", [])
         for prototype in prototypes:
@@ -367,6 +609,31 @@ class JavaScriptFileHandler(FileHandler):
         return js_file_content
 
 
+class DefaultFileHandler(FileHandler):
+    """Create the task files no other handler owns, and all test files."""
+
+    creates_test_files = True
+
+    def __init__(self, json_data: dict, handlers: list) -> None:
+        super().__init__(json_data, "Default", "")
+        self._handlers = list(handlers)
+        self._reserved_files = frozenset().union(
+            *(handler.generated_files() for handler in self._handlers)
+        )
+
+    def owns_file(self, directory: Path, name: str, suffix: str) -> bool:
+        if (directory, name) in self._reserved_files:
+            return False
+
+        return not any(
+            handler.owns_file(directory, name, suffix)
+            for handler in self._handlers
+        )
+
+    def get_file_content_specific(self, task: dict) -> list:
+        return []
+
+
 class ProjectCreator:
     def __init__(self, json_data: dict) -> None:
         self._json_data = json_data
@@ -376,6 +643,11 @@ class ProjectCreator:
             CFileHandler(json_data),
             JavaScriptFileHandler(json_data),
         ]
+        # Handlers own disjoint sets of files, so they can run in parallel:
+        # anything no handler claims, and every test file, is created by the
+        # default handler, and files a handler generates (such as the C
+        # header) win over task files of the same name
+        self._handlers.append(DefaultFileHandler(json_data, self._handlers))
 
     def start_project(self) -> None:
         """Starts the project creation process."""
@@ -384,8 +656,13 @@ class ProjectCreator:
             raise ValueError("No data provided. Project creation aborted.")
 
         try:
-            for handler in self._handlers:
-                handler.create_and_populate_files()
+            with ThreadPoolExecutor(max_workers=len(self._handlers)) as ex:
+                list(
+                    ex.map(
+                        lambda handler: handler.create_and_populate_files(),
+                        self._handlers,
+                    )
+                )
 
             self.create_and_populate_readme_file()
             self.create_and_populate_authors_file()
@@ -411,17 +688,7 @@ class ProjectCreator:
             readme_content.append(f"\n## {task.get('title')}\n")
             readme_content.extend(task.get("body", []))
 
-        readme_content.extend(
-            [
-                "",
-                "---",
-                "",
-                "*Please note that this README is dynamically generated and may not always reflect the most up-to-date information about the project.*",
-                "",
-                "---",
-                "",
-            ]
-        )
+        readme_content.extend(_README_FOOTER)
 
         readme_file_handler = FileHandler(self._json_data, "README", ".md")
         directory = readme_file_handler.get_root_directory()
@@ -434,12 +701,7 @@ class ProjectCreator:
 
         members = self._json_data.get("members", [])
         if members:
-            authors_content = [
-                "# This file lists all contributors to the repository.",
-                "",
-                "",
-            ]
-            authors_content.extend(members)
+            authors_content = [*_AUTHORS_HEADER, *members]
 
             authors_file_handler = FileHandler(self._json_data, "AUTHORS", "")
             directory = authors_file_handler.get_root_directory()
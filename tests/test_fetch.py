@@ -0,0 +1,269 @@
+import os
+from http.cookiejar import MozillaCookieJar
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from myalx import fetch
+
+PROJECT_URL = "https://intranet.alxswe.com/projects/100"
+
+SIGN_IN_PAGE = """
+<form action="/auth/sign_in" method="post">
+  <input type="hidden" name="authenticity_token" value="token">
+  <input type="email" name="user[email]">
+  <input type="password" name="user[password]">
+  <input type="checkbox" name="user[remember_me]" value="1">
+  <input type="submit" name="commit" value="Log in">
+</form>
+"""
+SIGN_IN_FAILED_PAGE = """
+<div class="alert alert-danger"> Invalid Email or password. </div>
+"""
+HOME_PAGE = '<body class="signed_in"></body>'
+PROJECT_PAGE = '<h1 class="gap">0x00. C - Hello, World</h1>'
+
+
+class FakeIntranet:
+    """Serve the sign-in flow and the project pages of the intranet."""
+
+    def __init__(self):
+        self.rejected_session = None
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append((request.method, request.url.path))
+        session = request.headers.get("cookie", "")
+
+        if request.url.path == "/auth/sign_in":
+            if request.method == "GET":
+                return httpx.Response(200, html=SIGN_IN_PAGE)
+
+            form = parse_qs(request.content.decode())
+            if form["user[password]"] != ["password"]:
+                return httpx.Response(200, html=SIGN_IN_FAILED_PAGE)
+
+            assert form["authenticity_token"] == ["token"]
+            assert form["user[email]"] == ["user@example.com"]
+            assert "user[remember_me]" not in form
+            assert "commit" not in form
+            return httpx.Response(
+                302,
+                headers={
+                    "location": "/",
+                    "set-cookie": "_session=valid; path=/",
+                },
+            )
+
+        if request.url.path == "/":
+            return httpx.Response(200, html=HOME_PAGE)
+
+        if self.rejected_session and self.rejected_session in session:
+            return httpx.Response(401)
+
+        if "_session=valid" not in session:
+            return httpx.Response(302, headers={"location": "/auth/sign_in"})
+
+        if request.url.path == "/projects/100":
+            return httpx.Response(200, html=PROJECT_PAGE)
+
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def cookie_file(tmp_path, monkeypatch):
+    cookie_file = tmp_path / "cache" / "cookies.jar"
+    monkeypatch.setattr(fetch, "_COOKIE_FILE", str(cookie_file))
+    return cookie_file
+
+
+@pytest.fixture
+def intranet(monkeypatch, cookie_file):
+    intranet = FakeIntranet()
+    client_class = httpx.Client
+    monkeypatch.setattr(
+        httpx,
+        "Client",
+        lambda **kwargs: client_class(
+            transport=httpx.MockTransport(intranet), **kwargs
+        ),
+    )
+    return intranet
+
+
+def fetch_test_project(url=PROJECT_URL, password="password"):
+    return fetch.fetch_project(url, "user@example.com", password)
+
+
+def saved_cookies(cookie_file):
+    cookie_jar = MozillaCookieJar(cookie_file)
+    cookie_jar.load(ignore_discard=True)
+    return {cookie.name: cookie.value for cookie in cookie_jar}
+
+
+def test_fetch_project_logs_in(intranet, cookie_file):
+    project = fetch_test_project()
+
+    assert project["title"] == "0x00. C - Hello, World"
+    assert intranet.requests == [
+        ("GET", "/projects/100"),
+        ("GET", "/auth/sign_in"),
+        ("POST", "/auth/sign_in"),
+        ("GET", "/"),
+        ("GET", "/projects/100"),
+    ]
+    assert saved_cookies(cookie_file) == {"_session": "valid"}
+
+
+def test_fetch_project_reuses_saved_session(intranet, cookie_file):
+    fetch_test_project()
+    intranet.requests.clear()
+
+    project = fetch_test_project()
+
+    assert project["title"] == "0x00. C - Hello, World"
+    assert intranet.requests == [("GET", "/projects/100")]
+
+
+def test_fetch_project_clears_rejected_session(intranet, cookie_file):
+    fetch_test_project()
+    saved_jar = cookie_file.read_text()
+    session_line = saved_jar.splitlines()[-1]
+    cookie_file.write_text(
+        saved_jar.replace("\tvalid", "\texpired")
+        + session_line.replace("_session\tvalid", "_remember\tstale")
+        + "\n"
+    )
+    intranet.rejected_session = "_session=expired"
+    intranet.requests.clear()
+
+    project = fetch_test_project()
+
+    assert project["title"] == "0x00. C - Hello, World"
+    assert intranet.requests == [
+        ("GET", "/projects/100"),
+        ("GET", "/auth/sign_in"),
+        ("POST", "/auth/sign_in"),
+        ("GET", "/"),
+        ("GET", "/projects/100"),
+    ]
+    assert saved_cookies(cookie_file) == {"_session": "valid"}
+
+
+def test_fetch_project_raises_on_missing_page(intranet, cookie_file):
+    with pytest.raises(fetch.FetchError, match=r"Page not found \(404\)"):
+        fetch_test_project("https://intranet.alxswe.com/projects/404")
+
+    assert not cookie_file.exists()
+
+
+def test_fetch_project_raises_on_failed_login(intranet, cookie_file):
+    with pytest.raises(fetch.FetchError, match="Invalid Email or password"):
+        fetch_test_project(password="wrong")
+
+    assert intranet.requests[-1] == ("POST", "/auth/sign_in")
+
+
+def test_cookie_jar_is_private(intranet, cookie_file):
+    fetch_test_project()
+
+    assert os.stat(cookie_file).st_mode & 0o777 == 0o600
+
+
+def test_pipeline_processes_project_item():
+    item = {
+        "title": "  0x0B. C - malloc, free ",
+        "tags": ["C"],
+        "members": ["ann smith"],
+        "requirements": [
+            "<ul>\n<li>A <code>README.md</code> file, at the root of the"
+            " folder of the project, is mandatory</li>\n</ul>",
+            "<ul>\n<li>A <code>1-README.md</code> file per task</li>\n"
+            "<li>The prototypes of all your functions should be included in"
+            " your header file called <code>main.h</code></li>\n"
+            "<li>Do not use <code>other.h</code></li>\n</ul>",
+        ],
+        "tasks": [
+            {
+                "type": " \n ",
+                "title": " 0. Float like a butterfly ",
+                "prototype": [],
+                "body": [
+                    "<p>Write a function that creates an array.</p>",
+                    "<pre><code>julien@ubuntu:~/0x0b$ cat 0-main.c\n"
+                    "#include &quot;main.h&quot;\n"
+                    "#include &lt;stdio.h&gt;\n"
+                    "\n"
+                    "int main(void)\n"
+                    "{\n"
+                    "    return (0);\n"
+                    "}\n"
+                    "julien@ubuntu:~/0x0b$ gcc -Wall 0-main.c 0-array.c"
+                    " -o a\n"
+                    "julien@ubuntu:~/0x0b$ ./a\n"
+                    "</code></pre>",
+                ],
+                "github_repository": "alx-low_level_programming",
+                "directory": "0x0B-malloc_free",
+                "file": "0-array.c",
+            }
+        ],
+    }
+
+    project = fetch.AlxPipeline().process_item(item, None)
+
+    assert project["title"] == "0x0B. C - malloc, free"
+    assert project["directory"] == "0x0B-malloc_free"
+    assert project["members"] == ["Ann Smith"]
+    assert project["requirements"] == {
+        "header": "main.h",
+        "readme.md": "README.md",
+    }
+
+    [task] = project["tasks"]
+    assert task["title"] == "0. Float like a butterfly"
+    assert "type" not in task
+    assert "prototype" not in task
+    assert task["file"] == ["0-array.c"]
+    assert task["test"] == [
+        {
+            "file": "0-main.c",
+            "content": [
+                '#include "main.h"',
+                "#include <stdio.h>",
+                "",
+                "int main(void)",
+                "{",
+                "    return (0);",
+                "}",
+            ],
+        }
+    ]
+    assert task["compilation"] == "gcc -Wall 0-main.c 0-array.c -o a"
+    assert task["body"] == [
+        "Write a function that creates an array.",
+        "",
+        "```console",
+        "julien@ubuntu:~/0x0b$ cat 0-main.c",
+        '#include "main.h"',
+        "#include <stdio.h>",
+        "int main(void)",
+        "{",
+        "    return (0);",
+        "}",
+        "julien@ubuntu:~/0x0b$ gcc -Wall 0-main.c 0-array.c -o a",
+        "julien@ubuntu:~/0x0b$ ./a",
+        "```",
+    ]
+
+
+def test_pipeline_drops_empty_values():
+    item = {
+        "title": " ",
+        "tags": [],
+        "requirements": ["<ul>\n<li>Use the Betty style</li>\n</ul>"],
+        "tasks": [],
+    }
+
+    assert fetch.AlxPipeline().process_item(item, None) == {}
@@ -0,0 +1,129 @@
+import pytest
+
+from myalx.project import CFileHandler, ProjectCreator, _parse_prototype
+
+
+def c_project(task_files):
+    return {
+        "title": "Lists",
+        "tags": ["C"],
+        "directory": "",
+        "requirements": {"header": "lists.h"},
+        "tasks": [
+            {
+                "title": "0. Print list",
+                "file": task_files,
+                "prototype": ["size_t print_list(const list_t *h);"],
+                "compilation": "gcc 0-main.c 0-print_list.c -o a",
+                "test": [{"file": "0-main.c", "content": ["int main(void)"]}],
+            }
+        ],
+    }
+
+
+def test_generated_header_wins_over_task_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    ProjectCreator(
+        c_project(["lists.h", "Makefile", "0-print_list.c"])
+    ).start_project()
+
+    header = (tmp_path / "lists.h").read_text()
+    assert header.startswith("#ifndef LISTS_H")
+    assert "size_t print_list(const list_t *h);" in header
+
+    makefile = (tmp_path / "Makefile").read_text()
+    assert makefile.startswith("# Makefile for Your Project")
+
+    assert (tmp_path / "0-print_list.c").is_file()
+    assert (tmp_path / "tests" / "0-main.c").read_text() == "int main(void)\n"
+
+
+@pytest.mark.parametrize(
+    "prototype, expected",
+    [
+        ("int _a(int x, char *y);", ("_a", ["x", "y"])),
+        ("char *_b(void);", ("_b", [])),
+        ("void weird", None),
+        ("int main(void)", ("main", [])),
+        ("int _putchar(char c);", ("_putchar", ["c"])),
+        (
+            "void print_numbers(const char *separator, const unsigned int n, ...);",
+            ("print_numbers", ["separator", "n"]),
+        ),
+        (
+            "int sum_them_all(const unsigned int n, ...);",
+            ("sum_them_all", ["n"]),
+        ),
+        (
+            "listint_t *add_nodeint(listint_t **head, const int n);",
+            ("add_nodeint", ["head", "n"]),
+        ),
+        ("size_t print_list(const list_t *h);", ("print_list", ["h"])),
+        (
+            "int **alloc_grid(int width, int height);",
+            ("alloc_grid", ["width", "height"]),
+        ),
+        (
+            "void free_grid(int **grid, int height);",
+            ("free_grid", ["grid", "height"]),
+        ),
+        ("int main(int argc, char *argv[])", ("main", ["argc"])),
+        ("int f(int)", ("f", [])),
+        (
+            "char *_strcpy(char *dest, char *src);",
+            ("_strcpy", ["dest", "src"]),
+        ),
+        ("void (*get_op_func(char *s))(int, int);", None),
+        ("int op_add(int a, int b);", ("op_add", ["a", "b"])),
+        (
+            "unsigned long int binary_to_uint(const char *b);",
+            ("binary_to_uint", ["b"]),
+        ),
+        (
+            "void simple_print_buffer(char *buffer, unsigned int size)",
+            ("simple_print_buffer", ["buffer", "size"]),
+        ),
+        ("int  spaced  ( int   a ,  int b ) ;", ("spaced", ["a", "b"])),
+        (
+            "dog_t *new_dog(char *name, float age, char *owner);",
+            ("new_dog", ["name", "age", "owner"]),
+        ),
+        ("int apply(void (*f)(int), int x);", ("apply", ["x"])),
+        (
+            "void array_iterator(int *array, size_t size, void (*action)(int));",
+            ("array_iterator", ["array", "size"]),
+        ),
+        (
+            "int int_index(int *array, int size, int (*cmp)(int));",
+            ("int_index", ["array", "size"]),
+        ),
+        (
+            "void print_all(const char * const format, ...);",
+            ("print_all", ["format"]),
+        ),
+        ("int f(int a", None),
+    ],
+)
+def test_parse_prototype(prototype, expected):
+    assert _parse_prototype(prototype) == expected
+
+
+def test_makefile_rules_with_overlapping_test_names():
+    handler = CFileHandler({"tags": ["C"]})
+    task = {
+        "file": ["1-print.c"],
+        "test": [{"file": "main.c"}, {"file": "0-main.c"}],
+    }
+    makefile_rules, output_filenames = [], set()
+
+    handler.add_makefile_rules(
+        task,
+        "gcc -Wall 0-main.c main.c 1-print.c -o print",
+        makefile_rules,
+        output_filenames,
+    )
+
+    rule = "\tgcc -Wall tests/0-main.c tests/main.c 1-print.c -o print\n"
+    assert makefile_rules == ["1-print:", rule]
+    assert output_filenames == {"print"}